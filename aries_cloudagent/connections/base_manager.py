@@ -8,9 +8,11 @@ import logging
 
 from typing import Sequence, Tuple, List
 
+from ..cache.base import BaseCache
 from ..core.error import BaseError
 from ..core.profile import ProfileSession
 from ..ledger.base import BaseLedger
+from ..ledger.util import DID_INFO_CACHE_PREFIX
 from ..protocols.connections.v1_0.messages.connection_invitation import (
     ConnectionInvitation,
 )
@@ -42,6 +44,7 @@ class BaseConnectionManager:
 
     RECORD_TYPE_DID_DOC = "did_doc"
     RECORD_TYPE_DID_KEY = "did_key"
+    LEDGER_DID_INFO_CACHE_TTL = 300
 
     def __init__(self, session: ProfileSession):
         """
@@ -216,12 +219,68 @@ class BaseConnectionManager:
             raise BaseConnectionManagerError(
                 f"Cannot resolve DID {public_did} without ledger instance"
             )
+        cache = self._session.inject(BaseCache, required=False)
+        if not cache:
+            return await self._fetch_from_ledger(ledger, public_did)
+
+        cache_key = f"{DID_INFO_CACHE_PREFIX}::{ledger.did_to_nym(public_did)}"
+        async with cache.acquire(cache_key) as entry:
+            if entry.result:
+                (endpoint, recipient_keys) = entry.result
+            else:
+                (endpoint, recipient_keys) = await self._fetch_from_ledger(
+                    ledger, public_did
+                )
+                if recipient_keys[0]:
+                    await entry.set_result(
+                        [endpoint, recipient_keys], self.LEDGER_DID_INFO_CACHE_TTL
+                    )
+
+        return (endpoint, recipient_keys)
+
+    async def _fetch_from_ledger(
+        self, ledger: BaseLedger, public_did: str
+    ) -> Tuple[str, Sequence[str]]:
+        """Look up endpoint and recipient keys for public DID on the ledger."""
         async with ledger:
             endpoint = await ledger.get_endpoint_for_did(public_did)
             recipient_keys = [await ledger.get_key_for_did(public_did)]
 
         return (endpoint, recipient_keys)
 
+    async def get_connection_targets(
+        self, *, connection_id: str = None, connection: ConnRecord = None
+    ):
+        """Create a connection target from a `ConnRecord`.
+
+        Args:
+            connection_id: The connection ID to search for
+            connection: The connection record itself, if already available
+        """
+        if not connection_id:
+            connection_id = connection.connection_id
+        cache = self._session.inject(BaseCache, required=False)
+        cache_key = f"connection_target::{connection_id}"
+        if cache:
+            async with cache.acquire(cache_key) as entry:
+                if entry.result:
+                    targets = [
+                        ConnectionTarget.deserialize(row) for row in entry.result
+                    ]
+                else:
+                    if not connection:
+                        connection = await ConnRecord.retrieve_by_id(
+                            self._session, connection_id
+                        )
+                    targets = await self.fetch_connection_targets(connection)
+                    if targets:
+                        await entry.set_result(
+                            [row.serialize() for row in targets], 3600
+                        )
+        else:
+            targets = await self.fetch_connection_targets(connection)
+        return targets
+
     async def fetch_connection_targets(
         self, connection: ConnRecord
     ) -> Sequence[ConnectionTarget]:
@@ -3,7 +3,7 @@
 import json
 
 from enum import Enum
-from typing import Any, Union
+from typing import Any, Sequence, Union
 
 from marshmallow import fields, validate
 
@@ -143,7 +143,14 @@ class ConnRecord(BaseRecord):
     RECORD_ID_NAME = "connection_id"
     WEBHOOK_TOPIC = "connections"
     LOG_STATE_FLAG = "debug.connections"
-    TAG_NAMES = {"my_did", "their_did", "request_id", "invitation_key"}
+    TAG_NAMES = {
+        "my_did",
+        "their_did",
+        "request_id",
+        "invitation_key",
+        "their_public_did",
+        "invitation_msg_id",
+    }
 
     RECORD_TYPE = "connection"
     RECORD_TYPE_INVITATION = "connection_invitation"
@@ -302,6 +309,26 @@ class ConnRecord(BaseRecord):
         tag_filter = {"request_id": request_id}
         return await cls.retrieve_by_tag_filter(session, tag_filter)
 
+    @classmethod
+    async def backfill_tags(cls, session: ProfileSession) -> int:
+        """Update stored tags on connection records saved before a tag was added.
+
+        Args:
+            session: The active profile session
+
+        Returns:
+            The number of records updated
+
+        """
+        storage = session.inject(BaseStorage)
+        updated = 0
+        for record in await storage.find_all_records(cls.RECORD_TYPE):
+            tags = cls.from_storage(record.id, json.loads(record.value)).tags
+            if tags != record.tags:
+                await storage.update_record(record, record.value, tags)
+                updated += 1
+        return updated
+
     async def attach_invitation(
         self,
         session: ProfileSession,
@@ -478,6 +505,20 @@ class ConnRecord(BaseRecord):
         except StorageNotFoundError as err:
             raise KeyError(f"{key} not found in connection metadata") from err
 
+    async def metadata_delete_many(self, session: ProfileSession, keys: Sequence[str]):
+        """Delete custom metadata under any of several keys, if present.
+
+        Args:
+            session (ProfileSession): session used for storage
+            keys (Sequence[str]): keys of metadata to delete
+        """
+        assert self.connection_id
+        storage: BaseStorage = session.inject(BaseStorage)
+        await storage.delete_all_records(
+            self.RECORD_TYPE_METADATA,
+            {"key": {"$in": list(keys)}, "connection_id": self.connection_id},
+        )
+
     async def metadata_get_all(self, session: ProfileSession) -> dict:
         """Return all custom metadata associated with this connection.
 
@@ -1,3 +1,5 @@
+import json
+
 from asynctest import TestCase as AsyncTestCase
 
 from ....core.in_memory import InMemoryProfile
@@ -8,6 +10,7 @@ from ....protocols.connections.v1_0.messages.connection_request import Connectio
 from ....protocols.connections.v1_0.models.connection_detail import ConnectionDetail
 from ....storage.base import BaseStorage
 from ....storage.error import StorageNotFoundError
+from ....storage.record import StorageRecord
 
 from ..conn_record import ConnRecord
 from ..diddoc.diddoc import DIDDoc
@@ -175,6 +178,35 @@ class TestConnRecord(AsyncTestCase):
         )
         assert result == record
 
+    async def test_backfill_tags(self):
+        record = ConnRecord(
+            connection_id="legacy-conn-id",
+            my_did=self.test_did,
+            their_did=self.test_target_did,
+            their_public_did=self.test_target_did,
+            invitation_msg_id="abc123",
+            state=ConnRecord.State.COMPLETED,
+        )
+        storage = self.session.inject(BaseStorage)
+        await storage.add_record(
+            StorageRecord(
+                ConnRecord.RECORD_TYPE,
+                json.dumps(record.value),
+                {"my_did": self.test_did, "their_did": self.test_target_did},
+                record.connection_id,
+            )
+        )
+        await self.test_conn_record.save(self.session)
+
+        assert await ConnRecord.backfill_tags(self.session) == 1
+        assert await ConnRecord.backfill_tags(self.session) == 0
+        stored = await storage.get_record(ConnRecord.RECORD_TYPE, "legacy-conn-id")
+        assert stored.tags == record.tags
+        result = await ConnRecord.retrieve_by_tag_filter(
+            self.session, {"their_public_did": self.test_target_did}
+        )
+        assert result.connection_id == "legacy-conn-id"
+
     async def test_completed_is_ready(self):
         record = ConnRecord(my_did=self.test_did, state=ConnRecord.State.COMPLETED)
         connection_id = await record.save(self.session)
@@ -334,6 +366,17 @@ class TestConnRecord(AsyncTestCase):
             await record.metadata_delete(self.session, "key")
             assert "key not found in connection metadata" in exc.msg
 
+    async def test_metadata_delete_many(self):
+        record = ConnRecord(
+            my_did=self.test_did,
+        )
+        await record.save(self.session)
+        await record.metadata_set(self.session, "key", {"test": "value"})
+        await record.metadata_set(self.session, "other", {"test": "other"})
+        await record.metadata_set(self.session, "kept", {"test": "kept"})
+        await record.metadata_delete_many(self.session, ["key", "other", "absent"])
+        assert await record.metadata_get_all(self.session) == {"kept": {"test": "kept"}}
+
     async def test_metadata_get_all(self):
         record = ConnRecord(
             my_did=self.test_did,
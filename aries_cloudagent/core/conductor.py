@@ -100,6 +100,10 @@ class Conductor:
         ):
             LOGGER.warning("No ledger configured")
 
+        # Tag connection records saved before their current tag set
+        async with self.root_profile.session() as session:
+            await ConnRecord.backfill_tags(session)
+
         # Register all inbound transports
         self.inbound_transport_manager = InboundTransportManager(
             self.root_profile, self.inbound_message_router, self.handle_not_returned
@@ -39,7 +39,7 @@ from .error import (
     LedgerError,
     LedgerTransactionError,
 )
-from .util import TAA_ACCEPTED_RECORD_TYPE
+from .util import DID_INFO_CACHE_PREFIX, TAA_ACCEPTED_RECORD_TYPE
 
 LOGGER = logging.getLogger(__name__)
 
@@ -939,6 +939,8 @@ class IndySdkLedger(BaseLedger):
                     nym, nym, None, attr_json, None
                 )
             await self._submit(request_json, True, True)
+            if self.pool.cache:
+                await self.pool.cache.clear(f"{DID_INFO_CACHE_PREFIX}::{nym}")
             return True
         return False
 
@@ -971,6 +973,10 @@ class IndySdkLedger(BaseLedger):
                 public_info.did, did, verkey, alias, role
             )
         await self._submit(request_json)  # let ledger raise on insufficient privilege
+        if self.pool.cache:
+            await self.pool.cache.clear(
+                f"{DID_INFO_CACHE_PREFIX}::{self.did_to_nym(did)}"
+            )
 
         try:
             did_info = await self.wallet.get_local_did(did)
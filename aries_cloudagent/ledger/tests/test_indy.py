@@ -18,6 +18,7 @@ from ..endpoint_type import EndpointType
 from ..indy import (
     BadLedgerRequestError,
     ClosedPoolError,
+    DID_INFO_CACHE_PREFIX,
     ErrorCode,
     IndyErrorHandler,
     IndyError,
@@ -2020,6 +2021,48 @@ class TestIndySdkLedger(AsyncTestCase):
             )
             assert response
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("indy.ledger.build_get_attrib_request")
+    @async_mock.patch("indy.ledger.build_attrib_request")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    async def test_update_endpoint_for_did_clears_did_info_cache(
+        self,
+        mock_submit,
+        mock_build_attrib_req,
+        mock_build_get_attrib_req,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+
+        endpoint = ["http://old.aries.ca", "http://new.aries.ca"]
+        mock_submit.side_effect = [
+            json.dumps(
+                {
+                    "result": {
+                        "data": json.dumps({"endpoint": {"endpoint": endpoint[i]}})
+                    }
+                }
+            )
+            for i in range(len(endpoint))
+        ]
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True, cache=InMemoryCache()), mock_wallet
+        )
+        cache_key = f"{DID_INFO_CACHE_PREFIX}::{self.test_did}"
+        await ledger.pool.cache.set(cache_key, [endpoint[0], [self.test_verkey]])
+
+        async with ledger:
+            mock_wallet.get_public_did = async_mock.CoroutineMock(
+                return_value=self.test_did_info
+            )
+            response = await ledger.update_endpoint_for_did(
+                f"did:sov:{self.test_did}", endpoint[1]
+            )
+            assert response
+            assert await ledger.pool.cache.get(cache_key) is None
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_attrib_request")
@@ -2468,6 +2511,54 @@ class TestIndySdkLedger(AsyncTestCase):
         async with ledger:
             await ledger.rotate_public_did_keypair()
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("indy.ledger.build_get_nym_request")
+    @async_mock.patch("indy.ledger.build_get_txn_request")
+    @async_mock.patch("indy.ledger.build_nym_request")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    async def test_rotate_public_did_keypair_clears_did_info_cache(
+        self,
+        mock_submit,
+        mock_build_nym_request,
+        mock_build_get_txn_request,
+        mock_build_get_nym_request,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock(
+            get_public_did=async_mock.CoroutineMock(return_value=self.test_did_info),
+            get_local_did=async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(metadata={})
+            ),
+            replace_local_did_metadata=async_mock.CoroutineMock(),
+            rotate_did_keypair_start=async_mock.CoroutineMock(
+                return_value=self.test_verkey
+            ),
+            rotate_did_keypair_apply=async_mock.CoroutineMock(return_value=None),
+        )
+        mock_submit.side_effect = [
+            json.dumps({"result": {"data": json.dumps({"seqNo": 1234})}}),
+            json.dumps(
+                {
+                    "result": {
+                        "data": {"txn": {"data": {"role": "101", "alias": "Billy"}}}
+                    }
+                }
+            ),
+            json.dumps({"result": {}}),
+        ]
+
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool("name", checked=True, cache=InMemoryCache()), mock_wallet
+        )
+        cache_key = f"{DID_INFO_CACHE_PREFIX}::{self.test_did}"
+        await ledger.pool.cache.set(cache_key, ["http://aries.ca", ["old-verkey"]])
+
+        async with ledger:
+            await ledger.rotate_public_did_keypair()
+            assert await ledger.pool.cache.get(cache_key) is None
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("indy.ledger.build_get_nym_request")
@@ -1,3 +1,4 @@
 """Ledger utilities."""
 
 TAA_ACCEPTED_RECORD_TYPE = "taa_accepted"
+DID_INFO_CACHE_PREFIX = "ledger_did_info"
@@ -11,6 +11,7 @@ from ..core.profile import (
 from ..messaging.responder import BaseResponder
 from ..config.wallet import wallet_config
 from ..config.injection_context import InjectionContext
+from ..connections.models.conn_record import ConnRecord
 from ..wallet.models.wallet_record import WalletRecord
 from ..wallet.base import BaseWallet
 from ..core.error import BaseError
@@ -170,6 +171,8 @@ class MultitenantManager:
 
             # MTODO: add ledger config
             profile, _ = await wallet_config(context, provision=provision)
+            async with profile.session() as session:
+                await ConnRecord.backfill_tags(session)
             self._instances[wallet_id] = profile
 
         return self._instances[wallet_id]
@@ -12,7 +12,6 @@ from ....cache.base import BaseCache
 from ....config.base import InjectionError
 from ....connections.base_manager import BaseConnectionManager
 from ....connections.models.conn_record import ConnRecord
-from ....connections.models.connection_target import ConnectionTarget
 from ....connections.util import mediation_record_if_id
 from ....core.error import BaseError
 from ....core.profile import ProfileSession
@@ -1063,36 +1062,6 @@ class ConnectionManager(BaseConnectionManager):
             receipt.sender_did, receipt.recipient_did, receipt.recipient_verkey, True
         )
 
-    async def get_connection_targets(
-        self, *, connection_id: str = None, connection: ConnRecord = None
-    ):
-        """Create a connection target from a `ConnRecord`.
-
-        Args:
-            connection_id: The connection ID to search for
-            connection: The connection record itself, if already available
-        """
-        if not connection_id:
-            connection_id = connection.connection_id
-        cache = self._session.inject(BaseCache, required=False)
-        cache_key = f"connection_target::{connection_id}"
-        if cache:
-            async with cache.acquire(cache_key) as entry:
-                if entry.result:
-                    targets = [
-                        ConnectionTarget.deserialize(row) for row in entry.result
-                    ]
-                else:
-                    if not connection:
-                        connection = await ConnRecord.retrieve_by_id(
-                            self._session, connection_id
-                        )
-                    targets = await self.fetch_connection_targets(connection)
-                    await entry.set_result([row.serialize() for row in targets], 3600)
-        else:
-            targets = await self.fetch_connection_targets(connection)
-        return targets
-
     async def establish_inbound(
         self,
         connection: ConnRecord,
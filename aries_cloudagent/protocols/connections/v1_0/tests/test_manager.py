@@ -1994,6 +1994,16 @@ class TestConnectionManager(AsyncTestCase):
         assert target.routing_keys == conn_invite.routing_keys
         assert target.sender_key == local_did.verkey
 
+    async def test_get_conn_targets_no_my_did_not_cached(self):
+        mock_conn = async_mock.MagicMock(my_did=None, connection_id="dummy")
+
+        for _ in range(2):
+            assert (
+                await self.manager.get_connection_targets(connection=mock_conn) is None
+            )
+        cache = self.context.inject(BaseCache)
+        assert await cache.get("connection_target::dummy") is None
+
     async def test_fetch_connection_targets_no_my_did(self):
         mock_conn = async_mock.MagicMock()
         mock_conn.my_did = None
@@ -2118,6 +2128,31 @@ class TestConnectionManager(AsyncTestCase):
         assert target.routing_keys == []
         assert target.sender_key == local_did.verkey
 
+    async def test_get_from_ledger_cached(self):
+        self.ledger = async_mock.MagicMock()
+        self.ledger.get_endpoint_for_did = async_mock.CoroutineMock(
+            return_value=self.test_endpoint
+        )
+        self.ledger.get_key_for_did = async_mock.CoroutineMock(
+            return_value=self.test_target_verkey
+        )
+        self.ledger.did_to_nym = async_mock.MagicMock(return_value=self.test_target_did)
+        self.context.injector.bind_instance(BaseLedger, self.ledger)
+
+        for _ in range(2):
+            (endpoint, recipient_keys) = await self.manager._get_from_ledger(
+                f"did:sov:{self.test_target_did}"
+            )
+            assert endpoint == self.test_endpoint
+            assert recipient_keys == [self.test_target_verkey]
+        self.ledger.get_endpoint_for_did.assert_called_once()
+        self.ledger.get_key_for_did.assert_called_once()
+        cache = self.context.inject(BaseCache)
+        assert await cache.get(f"ledger_did_info::{self.test_target_did}") == [
+            self.test_endpoint,
+            [self.test_target_verkey],
+        ]
+
     async def test_fetch_connection_targets_oob_invitation_svc_block_ledger(self):
         self.ledger = async_mock.MagicMock()
         self.ledger.get_endpoint_for_did = async_mock.CoroutineMock(
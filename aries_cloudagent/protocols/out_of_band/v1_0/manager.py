@@ -4,26 +4,31 @@ import asyncio
 import json
 import logging
 
-from typing import Mapping, Sequence, Optional
+from typing import Dict, Mapping, Sequence, Optional
 
 from aries_cloudagent.protocols.coordinate_mediation.v1_0.manager import (
     MediationManager,
 )
 
-from ....connections.base_manager import BaseConnectionManager
+from ....connections.base_manager import (
+    BaseConnectionManager,
+    BaseConnectionManagerError,
+)
 from ....connections.models.conn_record import ConnRecord
 from ....connections.util import mediation_record_if_id
 from ....core.error import BaseError
 from ....core.profile import ProfileSession
 from ....indy.holder import IndyHolder
-from ....messaging.responder import BaseResponder
+from ....messaging.agent_message import AgentMessage
+from ....messaging.responder import BaseResponder, ResponderError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....ledger.base import BaseLedger
 from ....ledger.error import LedgerError
 from ....multitenant.manager import MultitenantManager
-from ....storage.error import StorageNotFoundError
+from ....storage.error import StorageError, StorageNotFoundError
 from ....transport.inbound.receipt import MessageReceipt
 from ....wallet.base import BaseWallet
+from ....wallet.error import WalletError
 from ....wallet.util import naked_to_did_key, b64_to_bytes, did_key_to_naked
 
 from ...connections.v1_0.manager import ConnectionManager
@@ -50,6 +55,19 @@ from .messages.reuse_accept import HandshakeReuseAccept
 from .messages.service import Service as ServiceMessage
 from .models.invitation import InvitationRecord
 
+# Handshake protocols keyed by unqualified name, independent of DIDComm prefix
+HS_PROTOS_BY_NAME = {hsp.name: hsp for hsp in HSProto}
+
+# Request attachment handler method names, keyed by unqualified message type
+REQ_ATTACH_HANDLERS = {
+    PRESENTATION_REQUEST: "_process_pres_request_v1",
+    PRES_20_REQUEST: "_process_pres_request_v2",
+}
+
+# Reuse message state change signals, keyed by connection id
+REUSE_MSG_STATE_EVENTS: Dict[str, asyncio.Event] = {}
+REUSE_MSG_STATE_RECHECK = 1.0  # seconds between storage checks while waiting
+
 
 class OutOfBandManagerError(BaseError):
     """Out of band error."""
@@ -71,6 +89,8 @@ class OutOfBandManager(BaseConnectionManager):
         """
         self._session = session
         self._logger = logging.getLogger(__name__)
+        self._responder = None
+        self._auto_present = None
         super().__init__(self._session)
 
     @property
@@ -84,6 +104,34 @@ class OutOfBandManager(BaseConnectionManager):
         """
         return self._session
 
+    @property
+    def responder(self) -> Optional[BaseResponder]:
+        """
+        Accessor for the responder, looked up once per manager.
+
+        Returns:
+            The responder bound to the session context, or None
+
+        """
+        if self._responder is None:
+            self._responder = self._session.inject(BaseResponder, required=False)
+        return self._responder
+
+    @property
+    def auto_present(self) -> bool:
+        """
+        Accessor for whether to auto-respond to presentation requests.
+
+        Returns:
+            The debug.auto_respond_presentation_request setting, read once
+
+        """
+        if self._auto_present is None:
+            self._auto_present = bool(
+                self._session.settings.get("debug.auto_respond_presentation_request")
+            )
+        return self._auto_present
+
     async def create_invitation(
         self,
         my_label: str = None,
@@ -134,17 +182,15 @@ class OutOfBandManager(BaseConnectionManager):
             )
 
         wallet = self._session.inject(BaseWallet)
+        settings = self._session.settings
 
         # Multitenancy setup
         multitenant_mgr = self._session.inject(MultitenantManager, required=False)
-        wallet_id = self._session.settings.get("wallet.id")
+        wallet_id = settings.get("wallet.id")
 
         accept = bool(
             auto_accept
-            or (
-                auto_accept is None
-                and self._session.settings.get("debug.auto_accept_requests")
-            )
+            or (auto_accept is None and settings.get("debug.auto_accept_requests"))
         )
         if public:
             if multi_use:
@@ -158,61 +204,15 @@ class OutOfBandManager(BaseConnectionManager):
 
         message_attachments = []
         for atch in attachments or []:
-            a_type = atch.get("type")
-            a_id = atch.get("id")
-
-            if a_type == "credential-offer":
-                try:
-                    cred_ex_rec = await V10CredentialExchange.retrieve_by_id(
-                        self._session,
-                        a_id,
-                    )
-                    message_attachments.append(
-                        InvitationMessage.wrap_message(
-                            cred_ex_rec.credential_offer_dict
-                        )
-                    )
-                except StorageNotFoundError:
-                    cred_ex_rec = await V20CredExRecord.retrieve_by_id(
-                        self._session,
-                        a_id,
-                    )
-                    message_attachments.append(
-                        InvitationMessage.wrap_message(
-                            V20CredOffer.deserialize(cred_ex_rec.cred_offer).offer()
-                        )
-                    )
-            elif a_type == "present-proof":
-                try:
-                    pres_ex_rec = await V10PresentationExchange.retrieve_by_id(
-                        self._session,
-                        a_id,
-                    )
-                    message_attachments.append(
-                        InvitationMessage.wrap_message(
-                            pres_ex_rec.presentation_request_dict
-                        )
-                    )
-                except StorageNotFoundError:
-                    pres_ex_rec = await V20PresExRecord.retrieve_by_id(
-                        self._session,
-                        a_id,
-                    )
-                    message_attachments.append(
-                        InvitationMessage.wrap_message(
-                            V20PresRequest.deserialize(
-                                pres_ex_rec.pres_request
-                            ).attachment()
-                        )
-                    )
-            else:
-                raise OutOfBandManagerError(f"Unknown attachment type: {a_type}")
+            message_attachments.append(
+                await self._wrap_attachment(atch.get("type"), atch.get("id"))
+            )
 
         handshake_protocols = [
             DIDCommPrefix.qualify_current(hsp.name) for hsp in hs_protos or []
         ] or None
         if public:
-            if not self._session.settings.get("public_invites"):
+            if not settings.get("public_invites"):
                 raise OutOfBandManagerError("Public invitations are not enabled")
 
             public_did = await wallet.get_public_did()
@@ -222,7 +222,7 @@ class OutOfBandManager(BaseConnectionManager):
                 )
 
             invi_msg = InvitationMessage(  # create invitation message
-                label=my_label or self._session.settings.get("default_label"),
+                label=my_label or settings.get("default_label"),
                 handshake_protocols=handshake_protocols,
                 request_attach=message_attachments,
                 service=[f"did:sov:{public_did.did}"],
@@ -266,7 +266,7 @@ class OutOfBandManager(BaseConnectionManager):
             )
 
             if not my_endpoint:
-                my_endpoint = self._session.settings.get("default_endpoint")
+                my_endpoint = settings.get("default_endpoint")
 
             # Create and store new invitation key
             connection_key = await wallet.create_signing_key()
@@ -312,12 +312,12 @@ class OutOfBandManager(BaseConnectionManager):
                 )
 
                 if keylist_updates:
-                    responder = self._session.inject(BaseResponder, required=False)
+                    responder = self.responder
                     await responder.send(
                         keylist_updates, connection_id=mediation_record.connection_id
                     )
             routing_keys = [
-                key if len(key.split(":")) == 3 else naked_to_did_key(key)
+                key if key.count(":") == 2 else naked_to_did_key(key)
                 for key in routing_keys
             ]
             # Create connection invitation message
@@ -325,7 +325,7 @@ class OutOfBandManager(BaseConnectionManager):
             # of invitations
             # Would want to reuse create_did_document and convert the result
             invi_msg = InvitationMessage(
-                label=my_label or self._session.settings.get("default_label"),
+                label=my_label or settings.get("default_label"),
                 handshake_protocols=handshake_protocols,
                 request_attach=message_attachments,
                 service=[
@@ -346,8 +346,12 @@ class OutOfBandManager(BaseConnectionManager):
             await conn_rec.attach_invitation(self._session, invi_msg)
 
             if metadata:
-                for key, value in metadata.items():
-                    await conn_rec.metadata_set(self._session, key, value)
+                await asyncio.gather(
+                    *(
+                        conn_rec.metadata_set(self._session, key, value)
+                        for key, value in metadata.items()
+                    )
+                )
 
         return InvitationRecord(  # for return via admin API, not storage
             state=InvitationRecord.STATE_INITIAL,
@@ -356,6 +360,53 @@ class OutOfBandManager(BaseConnectionManager):
             invitation_url=invi_url,
         )
 
+    async def _wrap_attachment(self, a_type: str, a_id: str) -> AttachDecorator:
+        """
+        Wrap the offer or request of an exchange record as an invitation attachment.
+
+        Args:
+            a_type: attachment type, "credential-offer" or "present-proof"
+            a_id: identifier of the credential or presentation exchange record
+
+        Returns:
+            Attachment decorator for the invitation request~attach
+
+        """
+        if a_type == "credential-offer":
+            try:
+                cred_ex_rec = await V10CredentialExchange.retrieve_by_id(
+                    self._session,
+                    a_id,
+                )
+                return InvitationMessage.wrap_message(cred_ex_rec.credential_offer_dict)
+            except StorageNotFoundError:
+                cred_ex_rec = await V20CredExRecord.retrieve_by_id(
+                    self._session,
+                    a_id,
+                )
+                return InvitationMessage.wrap_message(
+                    V20CredOffer.deserialize(cred_ex_rec.cred_offer).offer()
+                )
+        elif a_type == "present-proof":
+            try:
+                pres_ex_rec = await V10PresentationExchange.retrieve_by_id(
+                    self._session,
+                    a_id,
+                )
+                return InvitationMessage.wrap_message(
+                    pres_ex_rec.presentation_request_dict
+                )
+            except StorageNotFoundError:
+                pres_ex_rec = await V20PresExRecord.retrieve_by_id(
+                    self._session,
+                    a_id,
+                )
+                return InvitationMessage.wrap_message(
+                    V20PresRequest.deserialize(pres_ex_rec.pres_request).attachment()
+                )
+
+        raise OutOfBandManagerError(f"Unknown attachment type: {a_type}")
+
     async def receive_invitation(
         self,
         invi_msg: InvitationMessage,
@@ -378,8 +429,6 @@ class OutOfBandManager(BaseConnectionManager):
             ConnRecord, serialized
 
         """
-        ledger: BaseLedger = self._session.inject(BaseLedger)
-
         if mediation_id:
             try:
                 await mediation_record_if_id(self._session, mediation_id)
@@ -403,43 +452,39 @@ class OutOfBandManager(BaseConnectionManager):
             # An existing connection can only be reused based on a public DID
             # in an out-of-band message (RFC 0434).
             service_did = invi_msg.service_dids[0]
-            async with ledger:
-                verkey = await ledger.get_key_for_did(service_did)
-                did_key = naked_to_did_key(verkey)
-                endpoint = await ledger.get_endpoint_for_did(service_did)
+            (endpoint, recipient_keys) = await self._get_from_ledger(service_did)
+            did_key = naked_to_did_key(recipient_keys[0])
             public_did = service_did.split(":")[-1]
-            service = ServiceMessage.deserialize(
-                {
-                    "id": "#inline",
-                    "type": "did-communication",
-                    "recipientKeys": [did_key],
-                    "routingKeys": [],
-                    "serviceEndpoint": endpoint,
-                }
+            service = ServiceMessage(
+                _id="#inline",
+                _type="did-communication",
+                recipient_keys=[did_key],
+                routing_keys=[],
+                service_endpoint=endpoint,
             )
 
-        unq_handshake_protos = [
-            HSProto.get(hsp)
-            for hsp in dict.fromkeys(
-                [
-                    DIDCommPrefix.unqualify(proto)
-                    for proto in invi_msg.handshake_protocols
-                ]
-            )
-        ]
+        unq_handshake_protos = []
+        seen_protos = set()
+        for proto in invi_msg.handshake_protocols:
+            unq_proto = DIDCommPrefix.unqualify(proto)
+            if unq_proto in seen_protos:
+                continue
+            seen_protos.add(unq_proto)
+            hsp = HS_PROTOS_BY_NAME.get(unq_proto) or HSProto.get(unq_proto)
+            if hsp is not None:
+                unq_handshake_protos.append(hsp)
 
         # Reuse Connection - only if started by an invitation with Public DID
         conn_rec = None
         if public_did is not None:  # invite has public DID: seek existing connection
-            tag_filter = {}
+            tag_filter = {"their_public_did": public_did}
             post_filter = {}
-            # post_filter["state"] = ConnRecord.State.COMPLETED.rfc160
-            post_filter["their_public_did"] = public_did
             conn_rec = await self.find_existing_connection(
                 tag_filter=tag_filter, post_filter=post_filter
             )
         if conn_rec is not None:
-            num_included_protocols = len(unq_handshake_protos)
+            # Count every distinct protocol offered, known to us or not
+            num_included_protocols = len(seen_protos)
             num_included_req_attachments = len(invi_msg.request_attach)
             # With handshake protocol, request attachment; use existing connection
             if (
@@ -458,26 +503,25 @@ class OutOfBandManager(BaseConnectionManager):
                         ),
                         15,
                     )
-                    await conn_rec.metadata_delete(
-                        session=self._session, key="reuse_msg_id"
-                    )
                     if (
                         await conn_rec.metadata_get(self._session, "reuse_msg_state")
                         == "not_accepted"
                     ):
+                        await conn_rec.metadata_delete(
+                            session=self._session, key="reuse_msg_id"
+                        )
                         conn_rec = None
                     else:
-                        await conn_rec.metadata_delete(
-                            session=self._session, key="reuse_msg_state"
+                        await conn_rec.metadata_delete_many(
+                            session=self._session,
+                            keys=["reuse_msg_id", "reuse_msg_state"],
                         )
                 except asyncio.TimeoutError:
                     # If no reuse_accepted or problem_report message was received within
                     # the 15s timeout then a new connection to be created
-                    await conn_rec.metadata_delete(
-                        session=self._session, key="reuse_msg_id"
-                    )
-                    await conn_rec.metadata_delete(
-                        session=self._session, key="reuse_msg_state"
+                    await conn_rec.metadata_delete_many(
+                        session=self._session,
+                        keys=["reuse_msg_id", "reuse_msg_state"],
                     )
                     conn_rec.state = ConnRecord.State.ABANDONED.rfc160
                     await conn_rec.save(self._session, reason="Sent connection request")
@@ -525,15 +569,12 @@ class OutOfBandManager(BaseConnectionManager):
                     service.routing_keys = [
                         did_key_to_naked(key) for key in service.routing_keys
                     ] or []
-                    connection_invitation = ConnectionInvitation.deserialize(
-                        {
-                            "@id": invi_msg._id,
-                            "@type": DIDCommPrefix.qualify_current(proto.name),
-                            "label": invi_msg.label,
-                            "recipientKeys": service.recipient_keys,
-                            "serviceEndpoint": service.service_endpoint,
-                            "routingKeys": service.routing_keys,
-                        }
+                    connection_invitation = ConnectionInvitation(
+                        _id=invi_msg._id,
+                        label=invi_msg.label,
+                        recipient_keys=service.recipient_keys,
+                        endpoint=service.service_endpoint,
+                        routing_keys=service.routing_keys,
                     )
                     conn_mgr = ConnectionManager(self._session)
                     conn_rec = await conn_mgr.receive_invitation(
@@ -551,31 +592,29 @@ class OutOfBandManager(BaseConnectionManager):
             req_attach = invi_msg.request_attach[0]
             if isinstance(req_attach, AttachDecorator):
                 if req_attach.data is not None:
+                    req_attach_content = req_attach.content
                     unq_req_attach_type = DIDCommPrefix.unqualify(
-                        req_attach.content["@type"]
+                        req_attach_content["@type"]
                     )
-                    if unq_req_attach_type == PRESENTATION_REQUEST:
-                        await self._process_pres_request_v1(
-                            req_attach=req_attach,
-                            service=service,
-                            conn_rec=conn_rec,
-                            trace=(invi_msg._trace is not None),
-                        )
-                    elif unq_req_attach_type == PRES_20_REQUEST:
-                        await self._process_pres_request_v2(
-                            req_attach=req_attach,
-                            service=service,
-                            conn_rec=conn_rec,
-                            trace=(invi_msg._trace is not None),
-                        )
-                    else:
+                    handler_name = REQ_ATTACH_HANDLERS.get(unq_req_attach_type)
+                    if not handler_name:
                         raise OutOfBandManagerError(
                             (
                                 "Unsupported request~attach type "
-                                f"{req_attach.content['@type']}: must unqualify to"
+                                f"{req_attach_content['@type']}: must unqualify to"
                                 f"{PRESENTATION_REQUEST} or {PRES_20_REQUEST}"
                             )
                         )
+                    await getattr(self, handler_name)(
+                        pres_request_msg=req_attach_content,
+                        service_decorator={
+                            "recipientKeys": list(service.recipient_keys),
+                            "routingKeys": list(service.routing_keys) or None,
+                            "serviceEndpoint": service.service_endpoint,
+                        },
+                        conn_rec=conn_rec,
+                        trace=(invi_msg._trace is not None),
+                    )
             else:
                 raise OutOfBandManagerError("request~attach is not properly formatted")
 
@@ -583,8 +622,8 @@ class OutOfBandManager(BaseConnectionManager):
 
     async def _process_pres_request_v1(
         self,
-        req_attach: AttachDecorator,
-        service: ServiceMessage,
+        pres_request_msg: dict,
+        service_decorator: dict,
         conn_rec: ConnRecord,
         trace: bool,
     ):
@@ -592,24 +631,18 @@ class OutOfBandManager(BaseConnectionManager):
         Create exchange for v1 pres request attachment, auto-present if configured.
 
         Args:
-            req_attach: request attachment on invitation
-            service: service message from invitation
+            pres_request_msg: presentation request message from invitation attachment
+            service_decorator: ~service decorator built from invitation service
             conn_rec: connection record
             trace: trace setting for presentation exchange record
         """
         pres_mgr = PresentationManager(self._session.profile)
-        pres_request_msg = req_attach.content
         indy_proof_request = json.loads(
             b64_to_bytes(
                 pres_request_msg["request_presentations~attach"][0]["data"]["base64"]
             )
         )
-        oob_invi_service = service.serialize()
-        pres_request_msg["~service"] = {
-            "recipientKeys": oob_invi_service.get("recipientKeys"),
-            "routingKeys": oob_invi_service.get("routingKeys"),
-            "serviceEndpoint": oob_invi_service.get("serviceEndpoint"),
-        }
+        pres_request_msg["~service"] = service_decorator
         pres_ex_record = V10PresentationExchange(
             connection_id=conn_rec.connection_id,
             thread_id=pres_request_msg["@id"],
@@ -617,43 +650,23 @@ class OutOfBandManager(BaseConnectionManager):
             role=V10PresentationExchange.ROLE_PROVER,
             presentation_request=indy_proof_request,
             presentation_request_dict=pres_request_msg,
-            auto_present=self._session.context.settings.get(
-                "debug.auto_respond_presentation_request"
-            ),
+            auto_present=self.auto_present,
             trace=trace,
         )
 
         pres_ex_record = await pres_mgr.receive_request(pres_ex_record)
         if pres_ex_record.auto_present:
-            try:
-                req_creds = await indy_proof_req_preview2indy_requested_creds(
-                    indy_proof_req=indy_proof_request,
-                    preview=None,
-                    holder=self._session.inject(IndyHolder),
-                )
-            except ValueError as err:
-                self._logger.warning(f"{err}")
-                raise OutOfBandManagerError(
-                    f"Cannot auto-respond to presentation request attachment: {err}"
-                )
+            req_creds = await self._auto_present_requested_creds(indy_proof_request)
 
             (pres_ex_record, presentation_message) = await pres_mgr.create_presentation(
                 presentation_exchange_record=pres_ex_record,
                 requested_credentials=req_creds,
                 comment=(
-                    "auto-presented for proof request nonce={}".format(
-                        indy_proof_request["nonce"]
-                    )
+                    "auto-presented for proof request "
+                    f"nonce={indy_proof_request['nonce']}"
                 ),
             )
-            responder = self._session.inject(BaseResponder, required=False)
-            if responder:
-                await responder.send(
-                    message=presentation_message,
-                    target_list=await self.fetch_connection_targets(
-                        connection=conn_rec
-                    ),
-                )
+            await self._send_auto_presentation(presentation_message, conn_rec)
         else:
             raise OutOfBandManagerError(
                 (
@@ -664,8 +677,8 @@ class OutOfBandManager(BaseConnectionManager):
 
     async def _process_pres_request_v2(
         self,
-        req_attach: AttachDecorator,
-        service: ServiceMessage,
+        pres_request_msg: dict,
+        service_decorator: dict,
         conn_rec: ConnRecord,
         trace: bool,
     ):
@@ -673,28 +686,20 @@ class OutOfBandManager(BaseConnectionManager):
         Create exchange for v2 pres request attachment, auto-present if configured.
 
         Args:
-            req_attach: request attachment on invitation
-            service: service message from invitation
+            pres_request_msg: presentation request message from invitation attachment
+            service_decorator: ~service decorator built from invitation service
             conn_rec: connection record
             trace: trace setting for presentation exchange record
         """
         pres_mgr = V20PresManager(self._session.profile)
-        pres_request_msg = req_attach.content
-        oob_invi_service = service.serialize()
-        pres_request_msg["~service"] = {
-            "recipientKeys": oob_invi_service.get("recipientKeys"),
-            "routingKeys": oob_invi_service.get("routingKeys"),
-            "serviceEndpoint": oob_invi_service.get("serviceEndpoint"),
-        }
+        pres_request_msg["~service"] = service_decorator
         pres_ex_record = V20PresExRecord(
             connection_id=conn_rec.connection_id,
             thread_id=pres_request_msg["@id"],
             initiator=V20PresExRecord.INITIATOR_EXTERNAL,
             role=V20PresExRecord.ROLE_PROVER,
             pres_request=pres_request_msg,
-            auto_present=self._session.context.settings.get(
-                "debug.auto_respond_presentation_request"
-            ),
+            auto_present=self.auto_present,
             trace=trace,
         )
 
@@ -705,35 +710,17 @@ class OutOfBandManager(BaseConnectionManager):
             ).attachment(
                 V20PresFormat.Format.INDY
             )  # assumption will change for DIF
-            try:
-                req_creds = await indy_proof_req_preview2indy_requested_creds(
-                    indy_proof_req=indy_proof_request,
-                    preview=None,
-                    holder=self._session.inject(IndyHolder),
-                )
-            except ValueError as err:
-                self._logger.warning(f"{err}")
-                raise OutOfBandManagerError(
-                    f"Cannot auto-respond to presentation request attachment: {err}"
-                )
+            req_creds = await self._auto_present_requested_creds(indy_proof_request)
 
             (pres_ex_record, pres_msg) = await pres_mgr.create_pres(
                 pres_ex_record=pres_ex_record,
                 requested_credentials=req_creds,
                 comment=(
-                    "auto-presented for proof request nonce={}".format(
-                        indy_proof_request["nonce"]
-                    )
+                    "auto-presented for proof request "
+                    f"nonce={indy_proof_request['nonce']}"
                 ),
             )
-            responder = self._session.inject(BaseResponder, required=False)
-            if responder:
-                await responder.send(
-                    message=pres_msg,
-                    target_list=await self.fetch_connection_targets(
-                        connection=conn_rec
-                    ),
-                )
+            await self._send_auto_presentation(pres_msg, conn_rec)
         else:
             raise OutOfBandManagerError(
                 (
@@ -742,16 +729,57 @@ class OutOfBandManager(BaseConnectionManager):
                 )
             )
 
+    async def _auto_present_requested_creds(self, indy_proof_request: dict) -> dict:
+        """
+        Build requested credentials to auto-respond to an indy proof request.
+
+        Args:
+            indy_proof_request: indy proof request from pres request attachment
+
+        Returns:
+            Requested credentials for the presentation
+
+        """
+        try:
+            return await indy_proof_req_preview2indy_requested_creds(
+                indy_proof_req=indy_proof_request,
+                preview=None,
+                holder=self._session.inject(IndyHolder),
+            )
+        except ValueError as err:
+            self._logger.warning("%s", err)
+            raise OutOfBandManagerError(
+                f"Cannot auto-respond to presentation request attachment: {err}"
+            )
+
+    async def _send_auto_presentation(
+        self, pres_msg: AgentMessage, conn_rec: ConnRecord
+    ):
+        """
+        Send an auto-presentation over the connection, if there is a responder.
+
+        Args:
+            pres_msg: presentation message to send
+            conn_rec: connection record
+        """
+        responder = self.responder
+        if responder:
+            await responder.send(
+                message=pres_msg,
+                target_list=await self.get_connection_targets(connection=conn_rec),
+            )
+
     async def find_existing_connection(
         self,
         tag_filter: dict,
         post_filter: dict,
     ) -> Optional[ConnRecord]:
         """
-        Find existing ConnRecord.
+        Find existing active ConnRecord.
 
         Args:
-            tag_filter: The filter dictionary to apply
+            tag_filter: The filter dictionary to apply; alternatives under "$or"
+                are preferred in the order given
             post_filter: Additional value filters to apply matching positively,
                 with sequence values specifying alternatives to match (hit any)
 
@@ -762,23 +790,28 @@ class OutOfBandManager(BaseConnectionManager):
         conn_records = await ConnRecord.query(
             self._session,
             tag_filter=tag_filter,
-            post_filter_positive=post_filter,
+            post_filter_positive={
+                **post_filter,
+                "state": [ConnRecord.State.COMPLETED.rfc160],
+            },
             alt=True,
         )
-        if not conn_records:
-            return None
-        else:
+        for alt_filter in tag_filter.get("$or", ()):
             for conn_rec in conn_records:
-                if conn_rec.state == "active":
+                tags = conn_rec.record_tags
+                if all(tags.get(k) == v for (k, v) in alt_filter.items()):
                     return conn_rec
-            return None
+        return conn_records[0] if conn_records else None
 
     async def check_reuse_msg_state(
         self,
         conn_rec: ConnRecord,
     ):
         """
-        Check reuse message state from the ConnRecord Metadata.
+        Wait for reuse message state in the ConnRecord Metadata to leave `initial`.
+
+        Waiting wakes up as soon as a reuse accepted message or problem report
+        updates the state, and rechecks storage periodically in the meantime.
 
         Args:
             conn_rec: The required ConnRecord with updated metadata
@@ -786,14 +819,30 @@ class OutOfBandManager(BaseConnectionManager):
         Returns:
 
         """
-        received = False
-        while not received:
-            if (
-                not await conn_rec.metadata_get(self._session, "reuse_msg_state")
-                == "initial"
-            ):
-                received = True
-        return
+        event = REUSE_MSG_STATE_EVENTS.setdefault(
+            conn_rec.connection_id, asyncio.Event()
+        )
+        try:
+            while True:
+                event.clear()
+                if (
+                    await conn_rec.metadata_get(self._session, "reuse_msg_state")
+                    != "initial"
+                ):
+                    return
+                try:
+                    await asyncio.wait_for(event.wait(), REUSE_MSG_STATE_RECHECK)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if REUSE_MSG_STATE_EVENTS.get(conn_rec.connection_id) is event:
+                del REUSE_MSG_STATE_EVENTS[conn_rec.connection_id]
+
+    def _signal_reuse_msg_state(self, conn_record: ConnRecord):
+        """Wake any waiter on the reuse message state of a connection."""
+        event = REUSE_MSG_STATE_EVENTS.get(conn_record.connection_id)
+        if event:
+            event.set()
 
     async def create_handshake_reuse_message(
         self,
@@ -821,25 +870,32 @@ class OutOfBandManager(BaseConnectionManager):
             reuse_msg = HandshakeReuse()
             thid = reuse_msg._id
             reuse_msg.assign_thread_id(thid=thid, pthid=pthid)
-            connection_targets = await self.fetch_connection_targets(
-                connection=conn_record
-            )
-            responder = self._session.inject(BaseResponder, required=False)
+            responder = self.responder
             if responder:
+                # Record reuse state before sending so a fast reply cannot precede it
+                (connection_targets, _, _) = await asyncio.gather(
+                    self.get_connection_targets(connection=conn_record),
+                    conn_record.metadata_set(
+                        session=self._session, key="reuse_msg_id", value=reuse_msg._id
+                    ),
+                    conn_record.metadata_set(
+                        session=self._session, key="reuse_msg_state", value="initial"
+                    ),
+                )
                 await responder.send(
                     message=reuse_msg,
                     target_list=connection_targets,
                 )
-                await conn_record.metadata_set(
-                    session=self._session, key="reuse_msg_id", value=reuse_msg._id
-                )
-                await conn_record.metadata_set(
-                    session=self._session, key="reuse_msg_state", value="initial"
-                )
-        except Exception as err:
+        except (
+            BaseConnectionManagerError,
+            LedgerError,
+            ResponderError,
+            StorageError,
+            WalletError,
+        ) as err:
             raise OutOfBandManagerError(
                 f"Error on creating and sending a handshake reuse message: {err}"
-            )
+            ) from err
 
     async def receive_reuse_message(
         self,
@@ -866,64 +922,33 @@ class OutOfBandManager(BaseConnectionManager):
         try:
             invi_msg_id = reuse_msg._thread.pthid
             reuse_msg_id = reuse_msg._thread.thid
-            tag_filter = {}
+            tag_filter = {"invitation_msg_id": invi_msg_id}
+            if receipt.sender_did:
+                tag_filter = {"$or": [tag_filter, {"their_did": receipt.sender_did}]}
             post_filter = {}
-            # post_filter["state"] = "active"
-            # tag_filter["their_did"] = receipt.sender_did
-            post_filter["invitation_msg_id"] = invi_msg_id
             conn_record = await self.find_existing_connection(
                 tag_filter=tag_filter, post_filter=post_filter
             )
-            responder = self._session.inject(BaseResponder, required=False)
+            # Problem Report is redundant if there is no active connection,
+            # as it cannot reach the invitee any way
             if conn_record is not None:
-                # For ConnRecords created using did-exchange
+                # Connection may have been created using did-exchange (matched on
+                # invitation message id) or RFC 0160 connections (on sender DID)
                 reuse_accept_msg = HandshakeReuseAccept()
                 reuse_accept_msg.assign_thread_id(thid=reuse_msg_id, pthid=invi_msg_id)
-                connection_targets = await self.fetch_connection_targets(
+                connection_targets = await self.get_connection_targets(
                     connection=conn_record
                 )
+                responder = self.responder
                 if responder:
                     await responder.send(
                         message=reuse_accept_msg,
                         target_list=connection_targets,
                     )
-                # This is not required as now we attaching the invitation_msg_id
-                # using original invitation [from existing connection]
-                #
-                # Delete the ConnRecord created; re-use existing connection
-                # invi_id_post_filter = {}
-                # invi_id_post_filter["invitation_msg_id"] = invi_msg_id
-                # conn_rec_to_delete = await self.find_existing_connection(
-                #     tag_filter={},
-                #     post_filter=invi_id_post_filter,
-                # )
-                # if conn_rec_to_delete is not None:
-                #     if conn_record.connection_id != conn_rec_to_delete.connection_id:
-                #         await conn_rec_to_delete.delete_record(session=self._session)
-            else:
-                conn_record = await self.find_existing_connection(
-                    tag_filter={"their_did": receipt.sender_did}, post_filter={}
-                )
-                # Problem Report is redundant in this case as with no active
-                # connection, it cannot reach the invitee any way
-                if conn_record is not None:
-                    # For ConnRecords created using RFC 0160 connections
-                    reuse_accept_msg = HandshakeReuseAccept()
-                    reuse_accept_msg.assign_thread_id(
-                        thid=reuse_msg_id, pthid=invi_msg_id
-                    )
-                    connection_targets = await self.fetch_connection_targets(
-                        connection=conn_record
-                    )
-                    if responder:
-                        await responder.send(
-                            message=reuse_accept_msg,
-                            target_list=connection_targets,
-                        )
-        except StorageNotFoundError:
+        except StorageNotFoundError as err:
             raise OutOfBandManagerError(
                 (f"No existing ConnRecord found for OOB Invitee, {receipt.sender_did}"),
-            )
+            ) from err
 
     async def receive_reuse_accepted_message(
         self,
@@ -948,25 +973,27 @@ class OutOfBandManager(BaseConnectionManager):
             HandshakeReuseAccept message
 
         """
+        invi_msg_id = reuse_accepted_msg._thread.pthid
+        thread_reuse_msg_id = reuse_accepted_msg._thread.thid
         try:
-            invi_msg_id = reuse_accepted_msg._thread.pthid
-            thread_reuse_msg_id = reuse_accepted_msg._thread.thid
             conn_reuse_msg_id = await conn_record.metadata_get(
                 session=self._session, key="reuse_msg_id"
             )
-            assert thread_reuse_msg_id == conn_reuse_msg_id
+            if thread_reuse_msg_id != conn_reuse_msg_id:
+                raise OutOfBandManagerError(
+                    "Error processing reuse accepted message "
+                    f"for OOB invitation {invi_msg_id}, thread id "
+                    f"{thread_reuse_msg_id} does not match reuse message id"
+                )
             await conn_record.metadata_set(
                 session=self._session, key="reuse_msg_state", value="accepted"
             )
-        except Exception as e:
+        except StorageError as e:
             raise OutOfBandManagerError(
-                (
-                    (
-                        "Error processing reuse accepted message "
-                        f"for OOB invitation {invi_msg_id}, {e}"
-                    )
-                )
-            )
+                "Error processing reuse accepted message "
+                f"for OOB invitation {invi_msg_id}, {e}"
+            ) from e
+        self._signal_reuse_msg_state(conn_record)
 
     async def receive_problem_report(
         self,
@@ -991,22 +1018,24 @@ class OutOfBandManager(BaseConnectionManager):
             HandshakeReuseAccept message
 
         """
+        invi_msg_id = problem_report._thread.pthid
+        thread_reuse_msg_id = problem_report._thread.thid
         try:
-            invi_msg_id = problem_report._thread.pthid
-            thread_reuse_msg_id = problem_report._thread.thid
             conn_reuse_msg_id = await conn_record.metadata_get(
                 session=self._session, key="reuse_msg_id"
             )
-            assert thread_reuse_msg_id == conn_reuse_msg_id
+            if thread_reuse_msg_id != conn_reuse_msg_id:
+                raise OutOfBandManagerError(
+                    "Error processing problem report message "
+                    f"for OOB invitation {invi_msg_id}, thread id "
+                    f"{thread_reuse_msg_id} does not match reuse message id"
+                )
             await conn_record.metadata_set(
                 session=self._session, key="reuse_msg_state", value="not_accepted"
             )
-        except Exception as e:
+        except StorageError as e:
             raise OutOfBandManagerError(
-                (
-                    (
-                        "Error processing problem report message "
-                        f"for OOB invitation {invi_msg_id}, {e}"
-                    )
-                )
-            )
+                "Error processing problem report message "
+                f"for OOB invitation {invi_msg_id}, {e}"
+            ) from e
+        self._signal_reuse_msg_state(conn_record)
@@ -56,7 +56,9 @@ from .....protocols.present_proof.v2_0.message_types import (
 from .....protocols.present_proof.v2_0.messages.pres import V20Pres
 from .....protocols.present_proof.v2_0.messages.pres_format import V20PresFormat
 from .....protocols.present_proof.v2_0.messages.pres_request import V20PresRequest
+from .....storage.base import BaseStorage
 from .....storage.error import StorageError, StorageNotFoundError
+from .....storage.record import StorageRecord
 from .....multitenant.manager import MultitenantManager
 from .....transport.inbound.receipt import MessageReceipt
 from .....wallet.base import DIDInfo, KeyInfo
@@ -272,6 +274,19 @@ class TestOOBManager(AsyncTestCase, TestConfig):
         self.test_mediator_conn_id = "mediator-conn-id"
         self.test_mediator_endpoint = "http://mediator.example.com"
 
+    async def _add_untagged_conn_rec(self, conn_rec: ConnRecord):
+        """Store a connection record with only the tags of older versions."""
+        legacy_tags = ("my_did", "their_did", "request_id", "invitation_key")
+        storage = self.session.inject(BaseStorage)
+        await storage.add_record(
+            StorageRecord(
+                ConnRecord.RECORD_TYPE,
+                json.dumps(conn_rec.value),
+                {k: v for (k, v) in conn_rec.record_tags.items() if k in legacy_tags},
+                conn_rec.connection_id,
+            )
+        )
+
     async def test_create_invitation_handshake_succeeds(self):
         self.session.context.update_settings({"public_invites": True})
 
@@ -677,6 +692,21 @@ class TestOOBManager(AsyncTestCase, TestConfig):
         )
         assert await record.metadata_get_all(self.session) == {"hello": "world"}
 
+    async def test_create_invitation_metadata_multiple_keys(self):
+        invi_rec = await self.manager.create_invitation(
+            hs_protos=[test_module.HSProto.RFC23],
+            metadata={"hello": "world", "more": {"nested": "value"}},
+        )
+        service = invi_rec.invitation["service"][0]
+        invitation_key = did_key_to_naked(service["recipientKeys"][0])
+        record = await ConnRecord.retrieve_by_invitation_key(
+            self.session, invitation_key
+        )
+        assert await record.metadata_get_all(self.session) == {
+            "hello": "world",
+            "more": {"nested": "value"},
+        }
+
     async def test_create_invitation_x_public_metadata(self):
         self.session.context.update_settings({"public_invites": True})
         with async_mock.patch.object(
@@ -969,6 +999,41 @@ class TestOOBManager(AsyncTestCase, TestConfig):
             with self.assertRaises(OutOfBandManagerError):
                 await self.manager.receive_invitation(mock_oob_invi)
 
+    async def test_receive_invitation_existing_conn_unknown_hs_protos(self):
+        await self.test_conn_rec.save(self.session)
+        await self.test_conn_rec.metadata_set(
+            self.session, "reuse_msg_state", "accepted"
+        )
+        with async_mock.patch.object(
+            self.ledger, "get_key_for_did", async_mock.CoroutineMock()
+        ) as mock_ledger_get_key_for_did, async_mock.patch.object(
+            OutOfBandManager,
+            "find_existing_connection",
+            async_mock.CoroutineMock(return_value=self.test_conn_rec),
+        ), async_mock.patch.object(
+            OutOfBandManager,
+            "check_reuse_msg_state",
+            autospec=True,
+        ) as oob_mgr_check_reuse_state, async_mock.patch.object(
+            OutOfBandManager,
+            "create_handshake_reuse_message",
+            autospec=True,
+        ) as oob_mgr_create_reuse_msg:
+            mock_ledger_get_key_for_did.return_value = TestConfig.test_verkey
+            oob_mgr_check_reuse_state.return_value = None
+            mock_oob_invi = async_mock.MagicMock(
+                service_blocks=[],
+                service_dids=[TestConfig.test_target_did],
+                handshake_protocols=["https://didcomm.org/didexchange/1.1"],
+                request_attach=[],
+            )
+
+            result = await self.manager.receive_invitation(
+                mock_oob_invi, use_existing_connection=True
+            )
+            oob_mgr_create_reuse_msg.assert_called_once()
+            assert result["connection_id"] == self.test_conn_rec.connection_id
+
     async def test_find_existing_connection(self):
         test_conn_rec = ConnRecord(
             my_did=TestConfig.test_did,
@@ -992,6 +1057,10 @@ class TestOOBManager(AsyncTestCase, TestConfig):
             tag_filter, post_filter
         )
         assert conn_record == test_conn_rec
+
+        tag_filter["their_public_did"] = self.their_public_did
+        conn_record = await self.manager.find_existing_connection(tag_filter, {})
+        assert conn_record == test_conn_rec
         await test_conn_rec.delete_record(self.session)
 
     async def test_find_existing_connection_no_active(self):
@@ -1006,6 +1075,63 @@ class TestOOBManager(AsyncTestCase, TestConfig):
         )
         assert conn_record is None
 
+        tag_filter["invitation_msg_id"] = "test_123"
+        conn_record = await self.manager.find_existing_connection(tag_filter, {})
+        assert conn_record is None
+
+        self.test_conn_rec.state = ConnRecord.State.COMPLETED.rfc160
+        await self.test_conn_rec.save(self.session)
+        conn_record = await self.manager.find_existing_connection(tag_filter, {})
+        assert conn_record == self.test_conn_rec
+
+    async def test_find_existing_connection_legacy_tags(self):
+        legacy_rec = ConnRecord(
+            connection_id="legacy-conn-id",
+            my_did=TestConfig.test_did,
+            their_did=TestConfig.test_target_did,
+            state=ConnRecord.State.COMPLETED,
+            their_public_did=self.their_public_did,
+            invitation_msg_id="test_123",
+        )
+        await self._add_untagged_conn_rec(legacy_rec)
+
+        tag_filter = {"their_did": TestConfig.test_target_did}
+        conn_record = await self.manager.find_existing_connection(tag_filter, {})
+        assert conn_record.connection_id == legacy_rec.connection_id
+
+        conn_record = await self.manager.find_existing_connection(
+            {}, {"invitation_msg_id": "test_123"}
+        )
+        assert conn_record.connection_id == legacy_rec.connection_id
+
+    async def test_find_existing_connection_prefers_first_alternative(self):
+        by_their_did = ConnRecord(
+            my_did=TestConfig.test_did,
+            their_did=TestConfig.test_target_did,
+            state=ConnRecord.State.COMPLETED,
+        )
+        await by_their_did.save(self.session)
+        by_invi_msg_id = ConnRecord(
+            my_did=TestConfig.test_did,
+            their_did="did:sov:other",
+            invitation_msg_id="test_123",
+            state=ConnRecord.State.COMPLETED,
+        )
+        await by_invi_msg_id.save(self.session)
+
+        tag_filter = {
+            "$or": [
+                {"invitation_msg_id": "test_123"},
+                {"their_did": TestConfig.test_target_did},
+            ]
+        }
+        conn_record = await self.manager.find_existing_connection(tag_filter, {})
+        assert conn_record == by_invi_msg_id
+
+        tag_filter["$or"].reverse()
+        conn_record = await self.manager.find_existing_connection(tag_filter, {})
+        assert conn_record == by_their_did
+
     async def test_check_reuse_msg_state(self):
         await self.test_conn_rec.save(self.session)
         await self.test_conn_rec.metadata_set(
@@ -1013,6 +1139,35 @@ class TestOOBManager(AsyncTestCase, TestConfig):
         )
         assert await self.manager.check_reuse_msg_state(self.test_conn_rec) is None
 
+    async def test_check_reuse_msg_state_wakes_on_accept(self):
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+            sender_did="test_did",
+        )
+        reuse_msg_accepted = HandshakeReuseAccept()
+        reuse_msg_accepted.assign_thread_id(thid="test_123", pthid="test_123")
+        await self.test_conn_rec.save(self.session)
+        await self.test_conn_rec.metadata_set(self.session, "reuse_msg_id", "test_123")
+        await self.test_conn_rec.metadata_set(
+            self.session, "reuse_msg_state", "initial"
+        )
+
+        with async_mock.patch.object(test_module, "REUSE_MSG_STATE_RECHECK", 60):
+            waiter = asyncio.ensure_future(
+                self.manager.check_reuse_msg_state(self.test_conn_rec)
+            )
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            await self.manager.receive_reuse_accepted_message(
+                reuse_msg_accepted, receipt, self.test_conn_rec
+            )
+            assert await asyncio.wait_for(waiter, 1) is None
+        assert (
+            self.test_conn_rec.connection_id not in test_module.REUSE_MSG_STATE_EVENTS
+        )
+
     async def test_create_handshake_reuse_msg(self):
         self.session.context.update_settings({"public_invites": True})
         await self.test_conn_rec.save(self.session)
@@ -1174,6 +1329,47 @@ class TestOOBManager(AsyncTestCase, TestConfig):
             await self.manager.receive_reuse_message(reuse_msg, receipt)
             assert len(self.responder.messages) == 0
 
+    async def test_receive_reuse_message_legacy_tags(self):
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+            sender_did="test_did",
+        )
+        reuse_msg = HandshakeReuse()
+        reuse_msg.assign_thread_id(thid="test_123", pthid="test_123")
+        legacy_rec = ConnRecord(
+            connection_id="legacy-conn-id",
+            my_did=TestConfig.test_did,
+            their_did=TestConfig.test_target_did,
+            invitation_msg_id="test_123",
+            state=ConnRecord.State.COMPLETED,
+        )
+        await self._add_untagged_conn_rec(legacy_rec)
+        await ConnRecord(
+            my_did=TestConfig.test_did,
+            their_did="test_did",
+            state=ConnRecord.State.COMPLETED,
+        ).save(self.session)
+        await ConnRecord.backfill_tags(self.session)
+        target = ConnectionTarget(
+            did=TestConfig.test_did,
+            endpoint=TestConfig.test_endpoint,
+            recipient_keys=TestConfig.test_verkey,
+            sender_key=TestConfig.test_verkey,
+        )
+        with async_mock.patch.object(
+            OutOfBandManager,
+            "fetch_connection_targets",
+            async_mock.CoroutineMock(return_value=[target]),
+        ) as oob_mgr_fetch_conn:
+            await self.manager.receive_reuse_message(reuse_msg, receipt)
+            assert (
+                oob_mgr_fetch_conn.call_args[0][0].connection_id
+                == legacy_rec.connection_id
+            )
+            self.responder.send.assert_called_once()
+            assert self.responder.send.call_args[1]["target_list"] == [target]
+
     async def test_receive_reuse_message_storage_not_found(self):
         self.session.context.update_settings({"public_invites": True})
         receipt = MessageReceipt(
@@ -1603,6 +1799,50 @@ class TestOOBManager(AsyncTestCase, TestConfig):
                 result.get("connection_id") == retrieved_conn_records[0].connection_id
             )
 
+    async def test_existing_conn_record_public_did_legacy_tags(self):
+        legacy_rec = ConnRecord(
+            connection_id="legacy-conn-id",
+            my_did=TestConfig.test_did,
+            their_did=TestConfig.test_target_did,
+            their_public_did=TestConfig.test_target_did,
+            state=ConnRecord.State.COMPLETED,
+        )
+        await self._add_untagged_conn_rec(legacy_rec)
+        await ConnRecord.backfill_tags(self.session)
+        await legacy_rec.metadata_set(self.session, "reuse_msg_state", "accepted")
+
+        with async_mock.patch.object(
+            self.ledger, "get_key_for_did", async_mock.CoroutineMock()
+        ) as mock_ledger_get_key_for_did, async_mock.patch.object(
+            DIDXManager, "receive_invitation", autospec=True
+        ) as didx_mgr_receive_invitation, async_mock.patch.object(
+            OutOfBandManager,
+            "check_reuse_msg_state",
+            autospec=True,
+        ) as oob_mgr_check_reuse_state, async_mock.patch.object(
+            OutOfBandManager,
+            "create_handshake_reuse_message",
+            autospec=True,
+        ) as oob_mgr_create_reuse_msg:
+            mock_ledger_get_key_for_did.return_value = TestConfig.test_verkey
+            oob_mgr_check_reuse_state.return_value = None
+            oob_mgr_create_reuse_msg.return_value = None
+            mock_oob_invi = async_mock.MagicMock(
+                handshake_protocols=[
+                    pfx.qualify(HSProto.RFC23.name) for pfx in DIDCommPrefix
+                ],
+                service_dids=[TestConfig.test_target_did],
+                service_blocks=[],
+                request_attach=[],
+            )
+
+            result = await self.manager.receive_invitation(
+                mock_oob_invi, use_existing_connection=True
+            )
+            assert result.get("connection_id") == legacy_rec.connection_id
+            oob_mgr_create_reuse_msg.assert_called_once()
+            didx_mgr_receive_invitation.assert_not_called()
+
     async def test_existing_conn_record_public_did_not_accepted(self):
         self.session.context.update_settings({"public_invites": True})
         test_exist_conn = ConnRecord(
@@ -3,6 +3,8 @@
 import base58
 import base64
 
+from functools import lru_cache
+
 from multicodec import add_prefix, remove_prefix
 
 
@@ -70,6 +72,7 @@ def full_verkey(did: str, abbr_verkey: str) -> str:
     )
 
 
+@lru_cache(maxsize=4096)
 def naked_to_did_key(key: str) -> str:
     """Convert a naked ed25519 verkey to W3C did:key format."""
     key_bytes = b58_to_bytes(key)
@@ -78,6 +81,7 @@ def naked_to_did_key(key: str) -> str:
     return did_key
 
 
+@lru_cache(maxsize=4096)
 def did_key_to_naked(did_key: str) -> str:
     """Convert a W3C did:key to naked ed25519 verkey format."""
     stripped_key = did_key.split("did:key:z").pop()